@@ -1,5 +1,4 @@
 from functools import partial
-from multiprocessing.pool import ThreadPool
 from threading import Lock
 from time import time
 
@@ -9,12 +8,13 @@ from ..base import InterfaceBase
 from ...config import config
 from ...debugging import get_logger
 from ...storage import StorageHelper
+from ...utilities.thread_pool import ForkSafeThreadPool
 
 from .events import MetricsEventAdapter
 
 
-upload_pool = ThreadPool(processes=1)
-file_upload_pool = ThreadPool(processes=config.get('network.metrics.file_upload_threads', 4))
+upload_pool = ForkSafeThreadPool(processes=1)
+file_upload_pool = ForkSafeThreadPool(processes=config.get('network.metrics.file_upload_threads', 4))
 
 log = get_logger('metrics')
 
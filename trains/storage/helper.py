@@ -6,7 +6,6 @@ from _socket import gethostname
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from datetime import datetime
-from multiprocessing.pool import ThreadPool
 from time import time
 from types import GeneratorType
 
@@ -32,6 +31,7 @@ from six.moves.urllib.request import url2pathname
 from ..config import config
 from ..debugging import get_logger
 from ..errors import UsageError
+from ..utilities.thread_pool import ForkSafeThreadPool
 
 log = get_logger('storage')
 level = config.get('storage.log.level', None)
@@ -42,7 +42,7 @@ if level:
     except (TypeError, ValueError):
         log.error('invalid storage log level in configuration: %s' % level)
 
-upload_pool = ThreadPool(processes=1)
+upload_pool = ForkSafeThreadPool(processes=1)
 
 
 class StorageError(Exception):
@@ -677,7 +677,7 @@ class StorageHelper(object):
             # remove target local_path if already exists
             try:
                 os.remove(local_path)
-            except:
+            except OSError:
                 pass
 
             if Path(temp_local_path).stat().st_size <= 0:
@@ -696,7 +696,7 @@ class StorageHelper(object):
                 try:
                     if temp_local_path:
                         os.remove(temp_local_path)
-                except:
+                except OSError:
                     pass
             return None
 
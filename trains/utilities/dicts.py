@@ -73,7 +73,7 @@ class NestedBlobsDict(BlobsDict):
     def get(self, keys_str, default=None):
         try:
             return self[keys_str]
-        except:
+        except Exception:
             return None
 
     def _keys(self, cur_dict, path):
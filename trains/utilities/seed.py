@@ -10,6 +10,8 @@ try:
 except Exception:
     cv2 = None
 
+SEEDED_RNG = None
+
 
 def make_deterministic(seed=1337, cudnn_deterministic=False):
     """
@@ -19,26 +21,22 @@ def make_deterministic(seed=1337, cudnn_deterministic=False):
     When using trains's task, call this function using the task's random seed like so:
         make_deterministic(task.get_random_seed())
 
+    Also sets seed.SEEDED_RNG to np.random.default_rng(seed) (numpy>=1.17); read it via the module attribute.
+
     :param int seed: Seed number
     :param bool cudnn_deterministic: In order to make computations deterministic on your specific platform
     and PyTorch release, set this value to True. torch will only allow those CuDNN algorithms that are
     (believed to be) deterministic. This can have a performance impact (slower execution) depending on your model.
     """
+    global SEEDED_RNG
     seed = int(seed) & 0xFFFFFFFF
-    torch = sys.modules.get("torch")
-    tf = sys.modules.get("tensorflow")
-
-    if cudnn_deterministic:
-        try:
-            torch.backends.cudnn.deterministic = True
-            torch.backends.cudnn.benchmark = False
-        except Exception:
-            pass
 
     random.seed(seed)
 
     if np is not None:
         np.random.seed(seed)
+        if hasattr(np.random, 'default_rng'):
+            SEEDED_RNG = np.random.default_rng(seed)
 
     if cv2 is not None:
         try:
@@ -46,31 +44,42 @@ def make_deterministic(seed=1337, cudnn_deterministic=False):
         except Exception:
             pass
 
+    torch = sys.modules.get("torch")
     if torch is not None:
-        try:
-            torch.manual_seed(seed)
-            torch.cuda.manual_seed(seed)
-        except Exception:
-            pass
+        _seed_torch(torch, seed, cudnn_deterministic)
 
+    tf = sys.modules.get("tensorflow")
     if tf is not None:
-        # reset graph state
+        _seed_tensorflow(tf, seed)
+
+
+def _seed_torch(torch, seed, cudnn_deterministic=False):
+    if cudnn_deterministic:
         try:
-            import tensorflow
-            from tensorflow.python.eager.context import _context
-            eager_mode_bypass = _context is None
+            torch.backends.cudnn.deterministic = True
+            torch.backends.cudnn.benchmark = False
         except Exception:
-            eager_mode_bypass = False
+            pass
+
+    try:
+        torch.manual_seed(seed)
+        torch.cuda.manual_seed(seed)
+    except Exception:
+        pass
 
-        if not eager_mode_bypass:
-            try:
-                tf.set_random_seed(seed)
-            except Exception:
-                pass
-            try:
-                tf.random.set_random_seed(seed)
-            except Exception:
-                pass
 
+def _seed_tensorflow(tf, seed):
+    # reset graph state, unless the eager context was never created
+    # (the context module is already loaded if tensorflow is, so there is no need to import it)
+    eager_context = sys.modules.get("tensorflow.python.eager.context")
+    if hasattr(eager_context, "_context") and eager_context._context is None:
+        return
 
-make_deterministic()
+    try:
+        tf.set_random_seed(seed)
+    except Exception:
+        pass
+    try:
+        tf.random.set_random_seed(seed)
+    except Exception:
+        pass
@@ -0,0 +1,47 @@
+import os
+import threading
+from functools import partial
+from multiprocessing.pool import ThreadPool
+
+
+class ForkSafeThreadPool(object):
+    """
+    A module level ThreadPool that keeps working in forked child processes.
+
+    ThreadPool worker threads do not survive fork(), so in a forked child the inherited pool is dropped and a new one
+    is created the first time it is used. Children that never use the pool do not start any threads.
+    apply_async/map_async are bound directly to the underlying pool, so calling them adds no per-call checks.
+    """
+    _delegated = ('apply_async', 'map_async')
+
+    def __init__(self, processes=None):
+        self._processes = processes
+        self._lock = threading.Lock()
+        self._pool = None
+        self._bind(ThreadPool(processes=processes))
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._reset)
+
+    def __getattr__(self, attr):
+        # only called for attributes that are not bound, i.e. anything other than apply_async/map_async
+        return getattr(self._get_pool(), attr)
+
+    def _bind(self, pool):
+        self._pool = pool
+        for name in self._delegated:
+            setattr(self, name, getattr(pool, name))
+
+    def _reset(self):
+        self._pool = None
+        self._lock = threading.Lock()
+        for name in self._delegated:
+            setattr(self, name, partial(self._create_and_call, name))
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._bind(ThreadPool(processes=self._processes))
+            return self._pool
+
+    def _create_and_call(self, name, *args, **kwargs):
+        return getattr(self._get_pool(), name)(*args, **kwargs)